@@ -6,6 +6,7 @@ from typing import List, Union
 import yaml
 
 from . import config
+from . import metrics
 from . import multicall3
 from .metrics import create_metric
 from .vendor.address_book import Address
@@ -179,13 +180,19 @@ class ContractCall:
         self.metrics.append(metric)
 
     async def __call__(self, w3, block, sem: asyncio.Semaphore) -> List[CallResult]:
+        name = str(self)
+
         async def execute_call(address, func):
-            async with sem:
-                try:
-                    return await func.call(block_identifier=block.number)
-                except Exception as e:
-                    logger.error("Error calling %s.%s: %s", address.name, func, e)
-                    raise
+            try:
+                async with metrics.timed_acquire(sem, metrics.CALL_QUEUE_WAIT_HISTOGRAM.labels(call=name)):
+                    with metrics.CALL_RPC_HISTOGRAM.labels(call=name).time():
+                        return_data = await multicall3.call_raw(w3, func, block.number)
+                metrics.CALL_RESPONSE_BYTES_HISTOGRAM.labels(call=name).observe(len(return_data))
+                with metrics.CALL_DECODE_HISTOGRAM.labels(call=name).time():
+                    return multicall3.decode_return_data(w3, func, return_data)
+            except Exception as e:
+                logger.error("Error calling %s.%s: %s", address.name, func, e)
+                raise
 
         calls = []
         for address in self.addresses:
@@ -197,29 +204,43 @@ class ContractCall:
         for address, result in zip(self.addresses, await asyncio.gather(*calls)):
             results.append(CallResult(address=address, value=result, labels=self.labels))
 
-        for metric in self.metrics:
-            metric.update(results)
-
-        logger.info("%s: updated %s metrics for %s addresses", self, len(self.metrics), len(self.addresses))
+        self.update_metrics(results)
 
         return results
 
+    def update_metrics(self, results: List[CallResult]):
+        with metrics.CALL_METRICS_UPDATE_HISTOGRAM.labels(call=str(self)).time():
+            for metric in self.metrics:
+                metric.update(results)
+
+        logger.info("%s: updated %s metrics for %s addresses", self, len(self.metrics), len(self.addresses))
+
     def __str__(self):
         return f"{self.contract_type}.{self.function}({','.join(arg.value for arg in self.arguments)})"
 
 
 class ContractCallMulticall3(ContractCall):
     async def __call__(self, w3, block, sem: asyncio.Semaphore) -> List[CallResult]:
+        name = str(self)
+
         functions = []
         for address in self.addresses:
             contract = w3.eth.contract(address=address.address, abi=self.abi, decode_tuples=True)
             function = contract.functions[self.function](*[arg.value for arg in self.arguments])
             functions.append(function)
 
+        agg3 = multicall3.encode_aggregate3(w3, functions)
+        metrics.MULTICALL_BATCH_SIZE_HISTOGRAM.labels(call=name).observe(len(functions))
+
         errors = 0
         results = []
-        async with sem:
-            chain_results = await multicall3.aggregate3(w3, functions, block.number)
+        async with metrics.timed_acquire(sem, metrics.CALL_QUEUE_WAIT_HISTOGRAM.labels(call=name)):
+            with metrics.CALL_RPC_HISTOGRAM.labels(call=name).time():
+                return_data = await multicall3.call_raw(w3, agg3, block.number)
+
+        metrics.CALL_RESPONSE_BYTES_HISTOGRAM.labels(call=name).observe(len(return_data))
+        with metrics.CALL_DECODE_HISTOGRAM.labels(call=name).time():
+            chain_results = multicall3.decode_aggregate3(w3, agg3, functions, return_data)
 
         for address, function, (success, result) in zip(self.addresses, functions, chain_results):
             if not success:
@@ -231,10 +252,7 @@ class ContractCallMulticall3(ContractCall):
         if errors:
             raise RuntimeError(f"{errors} errors calling {self.function}")
 
-        for metric in self.metrics:
-            metric.update(results)
-
-        logger.info("%s: updated %s metrics for %s addresses", self, len(self.metrics), len(self.addresses))
+        self.update_metrics(results)
 
         return results
 
@@ -32,3 +32,9 @@ ADDRESS_BOOK_PATH = env.str("ADDRESS_BOOK_PATH", None)
 # Limit the number of concurrent calls to the node. Going over 12 is likely to exceed Alchemy's rate
 # limit of 330CU/s on the free tier.
 MAX_CONCURRENT_CALLS = env.int("MAX_CONCURRENT_CALLS", 4)
+
+# Expose a sampling profiler of the event loop on the metrics server: /debug/profile?seconds=N
+PROFILING_ENABLED = env.bool("PROFILING_ENABLED", False)
+PROFILING_DEFAULT_SECONDS = env.float("PROFILING_DEFAULT_SECONDS", 10)
+PROFILING_MAX_SECONDS = env.float("PROFILING_MAX_SECONDS", 60)
+PROFILING_SAMPLE_INTERVAL = env.float("PROFILING_SAMPLE_INTERVAL", 0.005)
@@ -2,6 +2,7 @@ import asyncio
 import json
 import logging
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 
@@ -11,7 +12,7 @@ from web3 import AsyncWeb3
 from web3.middleware import ExtraDataToPOAMiddleware, validation
 from web3.providers import AsyncHTTPProvider
 
-from . import config, metrics
+from . import config, metrics, profiling
 from .chaindata import MetricsConfig
 from .vendor import address_book
 
@@ -87,7 +88,12 @@ async def main():
     metrics_config = MetricsConfig.load_yaml(config.METRICS_CONFIG_PATH)
 
     # Set up the prometheus server
-    prom_server = start_http_server_in_thread(port=config.METRICS_PORT)
+    if config.PROFILING_ENABLED:
+        prom_server = profiling.start_http_server_in_thread(
+            port=config.METRICS_PORT, thread_id=threading.get_ident()
+        )
+    else:
+        prom_server = start_http_server_in_thread(port=config.METRICS_PORT)
     logger.info("Started metrics server on %s", prom_server.url)
 
     w3 = AsyncWeb3(AsyncHTTPProvider(config.NODE_HTTPS_URL, cache_allowed_requests=True))
@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import asynccontextmanager
 from typing import List, Literal
 
 from prometheus_async.aio import time, track_inprogress
@@ -15,6 +16,30 @@ RPC_CALLS_HISTOGRAM = Histogram("rpc_calls_duration_seconds", "Duration of rpc c
 
 RPC_CALLS_IN_FLIGHT = Gauge("rpc_calls_in_flight", "Number of rpc calls in flight", ["method"])
 
+# Per contract call breakdown, labeled with the call definition (see ContractCall.__str__)
+CALL_QUEUE_WAIT_HISTOGRAM = Histogram(
+    "contract_call_queue_wait_seconds", "Time spent waiting for a concurrent calls slot", ["call"]
+)
+CALL_RPC_HISTOGRAM = Histogram("contract_call_rpc_duration_seconds", "Duration of the rpc request", ["call"])
+CALL_DECODE_HISTOGRAM = Histogram(
+    "contract_call_decode_duration_seconds", "Duration of the ABI decoding of the response", ["call"]
+)
+CALL_METRICS_UPDATE_HISTOGRAM = Histogram(
+    "contract_call_metrics_update_duration_seconds", "Duration of the metrics update", ["call"]
+)
+CALL_RESPONSE_BYTES_HISTOGRAM = Histogram(
+    "contract_call_response_bytes",
+    "Size of the rpc response data",
+    ["call"],
+    buckets=(32, 128, 512, 2048, 8192, 32768, 131072, 524288, float("inf")),
+)
+MULTICALL_BATCH_SIZE_HISTOGRAM = Histogram(
+    "multicall_batch_size",
+    "Number of calls aggregated in a single multicall",
+    ["call"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, float("inf")),
+)
+
 
 class RPCMetricsMiddleware(Web3Middleware):
     """Middleware to feed metrics of rpc call count and timing"""
@@ -29,6 +54,17 @@ class RPCMetricsMiddleware(Web3Middleware):
         return middleware
 
 
+@asynccontextmanager
+async def timed_acquire(sem: asyncio.Semaphore, histogram: Histogram):
+    """Acquires the semaphore, observing the time spent waiting for it"""
+    with histogram.time():
+        await sem.acquire()
+    try:
+        yield
+    finally:
+        sem.release()
+
+
 class AIOMonitor:
     """A class to monitor some basic asyncio metrics
 
@@ -79,12 +79,23 @@ def decode_return_data(w3, function, return_data) -> Any:
         return normalized_data
 
 
-async def aggregate3(w3, functions, block_identifier):
+def encode_aggregate3(w3, functions):
     multicall3 = w3.eth.contract(address=MULTICALL_ADDRESS, abi=MULTICALL_ABI, decode_tuples=True)
-    agg3 = multicall3.functions.aggregate3(
+    return multicall3.functions.aggregate3(
         [(fn.address, True, fn._encode_transaction_data()) for fn in functions]
     )
-    results = await agg3.call(block_identifier=block_identifier)
+
+
+async def call_raw(w3, function, block_identifier) -> bytes:
+    """Executes an eth_call for the function, returning the undecoded return data"""
+    return await w3.eth.call(
+        {"to": function.address, "data": function._encode_transaction_data()},
+        block_identifier=block_identifier,
+    )
+
+
+def decode_aggregate3(w3, agg3, functions, return_data):
+    results = decode_return_data(w3, agg3, return_data)
     return [
         (
             result.success,
@@ -92,3 +103,9 @@ async def aggregate3(w3, functions, block_identifier):
         )
         for result, fn in zip(results, functions)
     ]
+
+
+async def aggregate3(w3, functions, block_identifier):
+    agg3 = encode_aggregate3(w3, functions)
+    return_data = await call_raw(w3, agg3, block_identifier)
+    return decode_aggregate3(w3, agg3, functions, return_data)
@@ -0,0 +1,136 @@
+"""Sampling profiler for the main event loop, exposed on the metrics server under /debug/profile
+
+The samples are taken from the metrics server thread (which runs its own event loop), so the profiled loop
+doesn't need to cooperate and blocking code on it shows up as expected.
+"""
+
+import asyncio
+import marshal
+import queue
+import sys
+import threading
+from collections import Counter
+from typing import Dict, Tuple
+
+from aiohttp import web
+from prometheus_async.aio.web import MetricsHTTPServer, ThreadedMetricsHTTPServer, server_stats
+
+from . import config
+
+Frame = Tuple[str, int, str]  # (filename, first line number, function name), as used by pstats
+
+
+def _stack(frame) -> Tuple[Frame, ...]:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+async def sample_stacks(thread_id: int, seconds: float, interval: float) -> Counter:
+    """Samples the stack of the given thread every `interval` seconds, for `seconds` seconds"""
+    samples = Counter()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    while loop.time() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            samples[_stack(frame)] += 1
+        del frame
+        await asyncio.sleep(interval)
+    return samples
+
+
+def to_collapsed(samples: Counter) -> str:
+    """Formats the samples as collapsed stacks, as expected by flamegraph.pl or speedscope"""
+    lines = []
+    for stack, count in samples.most_common():
+        frames = ";".join(f"{name} ({filename}:{lineno})" for filename, lineno, name in stack)
+        lines.append(f"{frames} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def to_pstats(samples: Counter, seconds: float) -> bytes:
+    """Converts the samples to the marshalled format loaded by pstats.Stats
+
+    Call counts are sample counts, and times are estimated by splitting the profiled `seconds` evenly
+    between the samples (the sampler thread may get fewer samples than expected due to the GIL).
+    """
+    interval = seconds / max(sum(samples.values()), 1)
+    stats: Dict[Frame, list] = {}
+    for stack, count in samples.items():
+        duration = count * interval
+        seen = set()
+        for i, func in enumerate(stack):
+            entry = stats.setdefault(func, [0, 0, 0.0, 0.0, {}])
+            entry[1] += count
+            if func not in seen:
+                # Don't count the inclusive time twice for recursive calls
+                entry[0] += count
+                entry[3] += duration
+                seen.add(func)
+            if i == len(stack) - 1:
+                entry[2] += duration
+            if i > 0:
+                nc, cc, tt, ct = entry[4].get(stack[i - 1], (0, 0, 0.0, 0.0))
+                entry[4][stack[i - 1]] = (nc + count, cc + count, tt, ct + duration)
+    return marshal.dumps({func: tuple(entry) for func, entry in stats.items()})
+
+
+def profile_view(thread_id: int):
+    async def view(request: web.Request) -> web.Response:
+        try:
+            seconds = float(request.query.get("seconds", config.PROFILING_DEFAULT_SECONDS))
+        except ValueError:
+            raise web.HTTPBadRequest(text="seconds must be a number")
+        if not 0 < seconds <= config.PROFILING_MAX_SECONDS:
+            raise web.HTTPBadRequest(text=f"seconds must be between 0 and {config.PROFILING_MAX_SECONDS}")
+
+        output_format = request.query.get("format", "collapsed")
+        if output_format not in ("collapsed", "pstats"):
+            raise web.HTTPBadRequest(text="format must be one of: collapsed, pstats")
+
+        samples = await sample_stacks(thread_id, seconds, config.PROFILING_SAMPLE_INTERVAL)
+
+        if output_format == "pstats":
+            return web.Response(
+                body=to_pstats(samples, seconds),
+                content_type="application/octet-stream",
+                headers={"Content-Disposition": 'attachment; filename="eth-exporter.pstats"'},
+            )
+        return web.Response(text=to_collapsed(samples))
+
+    return view
+
+
+def start_http_server_in_thread(port: int, thread_id: int) -> ThreadedMetricsHTTPServer:
+    """Same as prometheus_async's start_http_server_in_thread, with the /debug/profile endpoint added
+
+    `thread_id` is the thread running the event loop to be profiled.
+    """
+    q = queue.Queue()
+    loop = asyncio.new_event_loop()
+
+    async def start_server():
+        app = web.Application()
+        app.router.add_get("/metrics", server_stats)
+        app.router.add_get("/debug/profile", profile_view(thread_id))
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "", port).start()
+        return MetricsHTTPServer.from_server(runner=runner, app=app, https=False)
+
+    def server():
+        asyncio.set_event_loop(loop)
+        http = loop.run_until_complete(start_server())
+        q.put(http)
+        loop.run_forever()
+        loop.run_until_complete(http.close())
+
+    thread = threading.Thread(target=server, name="PrometheusAsyncWebEndpoint", daemon=True)
+    thread.start()
+
+    return ThreadedMetricsHTTPServer(q.get(), thread, loop)